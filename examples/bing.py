@@ -1,4 +1,5 @@
-from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import threading
 import requests
 import datetime
@@ -9,7 +10,6 @@ from bs4 import BeautifulSoup
 
 
 add_lock = threading.Lock()
-count_queue = Queue()
 search_results = set()
 
 parser = argparse.ArgumentParser(description='FireProx API Bing Scraper')
@@ -20,10 +20,7 @@ args = parser.parse_args()
 
 
 def check_query(count, url, query):
-	if url[-1] == '/':
-		url = url[:-1]
-
-	url = f'{url}/search?q={query}&first={count}'
+	url = f'{url.rstrip("/")}/search?q={query}&first={count}'
 	headers = {
 		'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.14; rv:65.0) Gecko/20100101 Firefox/65.0',
 	}
@@ -32,21 +29,13 @@ def check_query(count, url, query):
 	soup = BeautifulSoup(results.text, 'lxml')
 
 	with add_lock:
-		idx = 1
 		for g in soup.find_all('li', class_='b_algo'):
 			result = g.find('h2')
-			link = result.find('a')['href']
-			title = result.text
-			item = f'{title} ({link})'
+			link = result.find('a') if result is not None else None
+			if link is None:
+				continue
+			item = f'{result.text} ({link["href"]})'
 			search_results.add(item)
-			idx+=1
-
-
-def process_queue(url, query):
-	while True:
-		current_count = count_queue.get()
-		check_query(current_count, url, query)
-		count_queue.task_done()
 
 
 def main():
@@ -54,18 +43,12 @@ def main():
 		parser.print_help()
 		sys.exit(1)
 
-	for i in range(100):
-		t = threading.Thread(target=process_queue, args=(args.proxy, args.search,))
-		t.daemon = True
-		t.start()
+	offsets = [0] + [count+1 for count in range(1,args.pages+1)[9::10]]
 
 	start = time.time()
 
-	count_queue.put(0)
-	for count in range(1,args.pages+1)[9::10]:
-		count_queue.put(count+1)
-
-	count_queue.join()
+	with ThreadPoolExecutor(max_workers=min(100, len(offsets))) as executor:
+		list(executor.map(partial(check_query, url=args.proxy, query=args.search), offsets))
 
 	for x in list(search_results):
 		print(x)
@@ -1,17 +1,34 @@
-from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import datetime
 import time
 import argparse
 import sys
-from bs4 import BeautifulSoup
+from urllib.parse import urlencode
+from lxml import etree
 
 
 add_lock = threading.Lock()
-count_queue = Queue()
 search_results = set()
 
+# Compiled once at import; Element.find would recompile its path per call
+extract_link = etree.XPath('descendant::a[1]')
+extract_title = etree.XPath('descendant::h3[1]')
+
+session = requests.Session()
+session.mount('https://', HTTPAdapter(pool_connections=128, pool_maxsize=128,
+	max_retries=Retry(total=3, backoff_factor=0.2)))
+session.headers.update({
+	'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.14; rv:65.0) Gecko/20100101 Firefox/65.0',
+	# urllib3 inflates gzip/deflate in C; br needs the brotli package
+	# (in requirements.txt) or the raw bytes would reach the parser
+	'Accept-Encoding': 'gzip, deflate, br',
+})
+
 parser = argparse.ArgumentParser(description='FireProx API Google Scraper')
 parser.add_argument('--proxy', help='FireProx API URL', type=str, default=None)
 parser.add_argument('--search', help='Search term', type=str, default=None)
@@ -19,33 +36,28 @@ parser.add_argument('--pages', help='Google search pages to enumerate (default:1
 args = parser.parse_args()
 
 
-def check_query(count, url, query):
-	if url[-1] == '/':
-		url = url[:-1]
-
-	url = f'{url}/search?q={query}&start={count}&num=100'
-	headers = {
-		'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.14; rv:65.0) Gecko/20100101 Firefox/65.0',
-	}
-	results = requests.get(url, headers=headers)
-
-	soup = BeautifulSoup(results.text, 'lxml')
-
+def check_query(count, base, query_string, session):
+	url = f'{base}?{query_string}&start={count}'
+	results = session.get(url, timeout=10, stream=True)
+
+	# Feed the response into a pull parser as it arrives so only a small
+	# window of the tree is alive at once instead of the whole DOM
+	parser = etree.HTMLPullParser(events=('end',), tag='div')
+	local = []
+	for chunk in results.iter_content(chunk_size=8192):
+		parser.feed(chunk)
+		for action, g in parser.read_events():
+			if g.get('class') == 'r':
+				a = extract_link(g)
+				h3 = extract_title(g)
+				if a and h3:
+					local.append(f'{"".join(h3[0].itertext())} ({a[0].get("href")})')
+			g.clear(keep_tail=True)
+	results.close()
+
+	# Only the shared-set update needs the lock; parsing stays parallel
 	with add_lock:
-		idx = 1
-		for g in soup.find_all('div', class_='r'):
-			link = g.find_all('a')[0]['href']
-			title = g.find_all('h3')[0]
-			item = f'{title.text} ({link})'
-			search_results.add(item)
-			idx+=1
-
-
-def process_queue(url, query):
-	while True:
-		current_count = count_queue.get()
-		check_query(current_count, url, query)
-		count_queue.task_done()
+		search_results.update(local)
 
 
 def main():
@@ -53,18 +65,16 @@ def main():
 		parser.print_help()
 		sys.exit(1)
 
-	for i in range(100):
-		t = threading.Thread(target=process_queue, args=(args.proxy, args.search,))
-		t.daemon = True
-		t.start()
+	offsets = [0] + list(range(1,args.pages+1)[99::100])
 
-	start = time.time()
+	# Build the fixed part of the URL once; workers only vary the offset
+	base = args.proxy.rstrip('/') + '/search'
+	query_string = urlencode({'q': args.search, 'num': 100})
 
-	count_queue.put(0)
-	for count in range(1,args.pages+1)[99::100]:
-		count_queue.put(count)
+	start = time.time()
 
-	count_queue.join()
+	with ThreadPoolExecutor(max_workers=min(100, len(offsets))) as executor:
+		list(executor.map(partial(check_query, base=base, query_string=query_string, session=session), offsets))
 
 	for x in list(search_results):
 		print(x)
@@ -1,17 +1,229 @@
 #!/usr/bin/env python3
-from multiprocessing import Pool
-from pathlib import Path
-import shutil
-import tldextract
-import boto3
+from concurrent.futures import ThreadPoolExecutor
 import os
 import sys
-import datetime
-import tzlocal
+import time
 import argparse
+import copy
+import functools
 import json
 import configparser
-from typing import Tuple, Callable
+from typing import Tuple
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=1)
+def _boto_config():
+    """Shared client settings: keep connections alive, size the pool for
+    the concurrent list/delete paths, and let botocore pace retries
+    adaptively. Built lazily so --help never imports botocore.
+
+    :return:
+    """
+    from botocore.config import Config
+    return Config(
+        retries={'max_attempts': 10, 'mode': 'adaptive'},
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        # Fail fast on unreachable endpoints; apigateway control-plane
+        # calls are small and never legitimately take the default 60s
+        connect_timeout=5,
+        read_timeout=30
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_session(profile_name, access_key, secret_access_key,
+                    session_token, region):
+    """Build (or reuse) a boto3 Session for one set of credentials.
+
+    Session construction re-walks the credential chain and reloads
+    botocore data files, so scripted callers creating several FireProx
+    instances share one Session per credential tuple.
+
+    :return:
+    """
+    import boto3
+    return boto3.session.Session(
+        profile_name=profile_name,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_access_key,
+        aws_session_token=session_token,
+        region_name=region
+    )
+
+
+def _normalize_url(url: str) -> str:
+    """Default to https and strip any trailing slash so path joins stay
+    predictable
+
+    :return:
+    """
+    if not url.startswith(('http://', 'https://')):
+        url = f'https://{url}'
+    return url.rstrip('/')
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_domain(url: str) -> str:
+    """Pull a domain label out of a URL for the API title, memoized per URL.
+
+    The label only feeds the fireprox_<domain> display name, so the
+    second-to-last host label is plenty; no public-suffix list needed.
+
+    :return:
+    """
+    if '://' not in url:
+        url = f'http://{url}'
+    host = urlsplit(url).hostname or ''
+    parts = host.split('.')
+    return parts[-2] if len(parts) >= 2 else host
+
+
+# Resolved once; expanduser hits the password database on POSIX
+_AWS_CREDENTIALS_FILE = os.path.expanduser('~/.aws/credentials')
+_AWS_CONFIG_FILE = os.path.expanduser('~/.aws/config')
+
+_CONFIG_CACHE = {}
+
+
+def _parse_ini(path: str) -> dict:
+    """Minimal INI read: nested dict of sections to key/value pairs.
+
+    configparser carries interpolation and validation machinery we never
+    use on the read path; a line scan is enough for ~/.aws files.
+
+    :return:
+    """
+    sections = {}
+    current = None
+    try:
+        with open(path) as handle:
+            for line in handle:
+                line = line.strip()
+                if not line or line.startswith(('#', ';')):
+                    continue
+                if line.startswith('[') and line.endswith(']'):
+                    current = sections.setdefault(line[1:-1].strip(), {})
+                elif '=' in line and current is not None:
+                    key, _, value = line.partition('=')
+                    current[key.strip()] = value.strip()
+    except OSError:
+        pass
+    return sections
+
+
+def _write_ini(parser: configparser.ConfigParser, path: str):
+    """Atomically replace an INI file via temp file + rename.
+
+    Keeps 0600 permissions and means a crash mid-write never leaves a
+    half-written credentials file behind.
+
+    :return:
+    """
+    temp_path = f'{path}.tmp'
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, 'w') as file:
+            parser.write(file)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_ini(path: str) -> dict:
+    """Parse an INI file, reusing the parsed copy until its mtime changes
+
+    :return:
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    parsed = _parse_ini(path)
+    _CONFIG_CACHE[path] = (mtime, parsed)
+    return parsed
+
+
+_PROXY_PARAMETERS = [
+    {
+        'name': 'proxy',
+        'in': 'path',
+        'required': True,
+        'type': 'string'
+    },
+    {
+        'name': 'X-My-X-Forwarded-For',
+        'in': 'header',
+        'required': False,
+        'type': 'string'
+    }
+]
+
+_PROXY_INTEGRATION = {
+    'uri': None,
+    'responses': {
+        'default': {
+            'statusCode': '200'
+        }
+    },
+    'requestParameters': {
+        'integration.request.path.proxy': 'method.request.path.proxy',
+        'integration.request.header.X-Forwarded-For': 'method.request.header.X-My-X-Forwarded-For'
+    },
+    'passthroughBehavior': 'when_no_match',
+    'httpMethod': 'ANY',
+    'cacheNamespace': 'irx7tm',
+    'cacheKeyParameters': [
+        'method.request.path.proxy'
+    ],
+    'type': 'http_proxy'
+}
+
+_TEMPLATE = {
+    'swagger': '2.0',
+    'info': {
+        'version': None,
+        'title': None
+    },
+    'basePath': '/',
+    'schemes': [
+        'https'
+    ],
+    'paths': {
+        '/': {
+            'get': {
+                'parameters': _PROXY_PARAMETERS,
+                'responses': {},
+                # Each path gets its own integration dict so the two uri
+                # fields can be filled independently after a deepcopy
+                'x-amazon-apigateway-integration': copy.deepcopy(_PROXY_INTEGRATION)
+            }
+        },
+        '/{proxy+}': {
+            'x-amazon-apigateway-any-method': {
+                'produces': [
+                    'application/json'
+                ],
+                'parameters': _PROXY_PARAMETERS,
+                'responses': {},
+                'x-amazon-apigateway-integration': copy.deepcopy(_PROXY_INTEGRATION)
+            }
+        }
+    }
+}
 
 
 class FireProx(object):
@@ -24,9 +236,13 @@ class FireProx(object):
         self.command = arguments.command
         self.api_id = arguments.api_id
         self.url = arguments.url
+        self.urls_file = getattr(arguments, 'urls_file', None)
         self.api_list = []
+        self.session = None
         self.client = None
         self.help = help_text
+        # api_id -> proxy resource id, so repeat lookups skip get_resources
+        self._resource_cache = {}
 
         if self.access_key and self.secret_access_key:
             if not self.region:
@@ -41,207 +257,165 @@ class FireProx(object):
     def __str__(self):
         return 'FireProx()'
 
-    def _try_instance_profile(self) -> bool:
-        """Try instance profile credentials
-
-        :return:
-        """
-        try:
-            if not self.region:
-                self.client = boto3.client('apigateway')
-            else:
-                self.client = boto3.client(
-                    'apigateway',
-                    region_name=self.region
-                )
-            self.client.get_account()
-            self.region = self.client._client_config.region_name
-            return True
-        except:
-            return False
-
     def load_creds(self) -> bool:
         """Load credentials from AWS config and credentials files if present.
 
         :return:
         """
-        # If no access_key, secret_key, or profile name provided, try instance credentials
+        # If no access_key, secret_key, or profile name provided, let the
+        # default provider chain (env vars, instance profile, ...) resolve
+        # credentials on first use. Problems surface on the first real API
+        # call; probing here would just add a round-trip.
         if not any([self.access_key, self.secret_access_key, self.profile_name]):
-            return self._try_instance_profile()
-        # Read in AWS config/credentials files if they exist
-        credentials = configparser.ConfigParser()
-        credentials.read(os.path.expanduser('~/.aws/credentials'))
-        config = configparser.ConfigParser()
-        config.read(os.path.expanduser('~/.aws/config'))
-        # If profile in files, try it, but flow through if it does not work
-        config_profile_section = f'profile {self.profile_name}'
-        if self.profile_name in credentials:
-            if config_profile_section not in config:
-                print(f'Please create a section for {self.profile_name} in your ~/.aws/config file')
-                return False
-            self.region = config[config_profile_section].get('region', 'us-east-1')
             try:
-                self.client = boto3.session.Session(profile_name=self.profile_name,
-                        region_name=self.region).client('apigateway')
-                self.client.get_account()
+                self.session = _cached_session(None, None, None, None, self.region)
+                self.client = self.session.client('apigateway', config=_boto_config())
+                self.region = self.client.meta.region_name
                 return True
             except:
+                return False
+        # Profile-only: boto3 resolves the profile (and its region) through
+        # botocore's own shared, cached credential resolver, so try that
+        # before doing any file parsing of our own
+        if self.profile_name and not (self.access_key or self.secret_access_key):
+            from botocore.exceptions import BotoCoreError
+            try:
+                self.session = _cached_session(self.profile_name, None, None,
+                        None, self.region)
+                self.client = self.session.client('apigateway',
+                        config=_boto_config())
+                self.region = self.client.meta.region_name
+                return True
+            except BotoCoreError:
+                # Unknown profile or no resolvable region; fall back to the
+                # explicit config-file handling below
                 pass
-        # Maybe had profile, maybe didn't
+        # Only read ~/.aws when a profile is involved; static keys with no
+        # profile name need no file I/O at all
+        if self.profile_name:
+            credentials = _load_ini(_AWS_CREDENTIALS_FILE)
+            config = _load_ini(_AWS_CONFIG_FILE)
+        # Keys supplied on the command line always win over anything the
+        # files hold, so rotating a stored profile's keys actually takes
+        # effect (and gets persisted) instead of the stale profile loading
         if self.access_key and self.secret_access_key:
             try:
-                self.client = boto3.client(
-                    'apigateway',
-                    aws_access_key_id=self.access_key,
-                    aws_secret_access_key=self.secret_access_key,
-                    aws_session_token=self.session_token,
-                    region_name=self.region
-                )
-                self.client.get_account()
-                self.region = self.client._client_config.region_name
-                # Save/overwrite config if profile specified
-                if self.profile_name:
-                    if config_profile_section not in config:
-                        config.add_section(config_profile_section)
-                    config[config_profile_section]['region'] = self.region
-                    with open(os.path.expanduser('~/.aws/config'), 'w') as file:
-                        config.write(file)
-                    if self.profile_name not in credentials:
-                        credentials.add_section(self.profile_name)
-                    credentials[self.profile_name]['aws_access_key_id'] = self.access_key
-                    credentials[self.profile_name]['aws_secret_access_key'] = self.secret_access_key
-                    if self.session_token:
-                        credentials[self.profile_name]['aws_session_token'] = self.session_token
-                    else:
-                        credentials.remove_option(self.profile_name, 'aws_session_token')
-                    with open(os.path.expanduser('~/.aws/credentials'), 'w') as file:
-                        credentials.write(file)
+                self.session = _cached_session(None, self.access_key,
+                        self.secret_access_key, self.session_token,
+                        self.region)
+                self.client = self.session.client('apigateway', config=_boto_config())
+                self.region = self.client.meta.region_name
+                # Save/overwrite config if profile specified and anything
+                # actually changed; skip the rewrites (and mtime bumps)
+                # when the stored values already match
+                if self.profile_name and not self._stored_creds_match(config, credentials):
+                    try:
+                        self._write_profile()
+                    except PermissionError:
+                        # Read-only home directories degrade gracefully;
+                        # the in-memory credentials still work
+                        pass
                 return True
             except:
                 return False
+        # Profile in files with no explicit keys
+        config_profile_section = f'profile {self.profile_name}'
+        if self.profile_name and self.profile_name in credentials:
+            if config_profile_section not in config:
+                print(f'Please create a section for {self.profile_name} in your ~/.aws/config file')
+                return False
+            self.region = config[config_profile_section].get('region', 'us-east-1')
+            try:
+                self.session = _cached_session(self.profile_name, None, None,
+                        None, self.region)
+                self.client = self.session.client('apigateway', config=_boto_config())
+                return True
+            except:
+                pass
+        return False
+
+    def _stored_creds_match(self, config, credentials) -> bool:
+        """Check whether ~/.aws already holds the supplied profile values
+
+        :return:
+        """
+        config_profile_section = f'profile {self.profile_name}'
+        profile = credentials.get(self.profile_name, {})
+        return (
+            config.get(config_profile_section, {}).get('region') == self.region and
+            profile.get('aws_access_key_id') == self.access_key and
+            profile.get('aws_secret_access_key') == self.secret_access_key and
+            profile.get('aws_session_token') == self.session_token
+        )
+
+    def _write_profile(self):
+        """Persist the supplied profile to ~/.aws.
+
+        configparser is only needed here, on the rare write path; reads go
+        through the fast line parser.
+
+        :return:
+        """
+        config_profile_section = f'profile {self.profile_name}'
+        config = configparser.ConfigParser()
+        if os.path.exists(_AWS_CONFIG_FILE):
+            with open(_AWS_CONFIG_FILE) as file:
+                config.read_file(file)
+        if config_profile_section not in config:
+            config.add_section(config_profile_section)
+        config[config_profile_section]['region'] = self.region
+        _write_ini(config, _AWS_CONFIG_FILE)
+        credentials = configparser.ConfigParser()
+        if os.path.exists(_AWS_CREDENTIALS_FILE):
+            with open(_AWS_CREDENTIALS_FILE) as file:
+                credentials.read_file(file)
+        if self.profile_name not in credentials:
+            credentials.add_section(self.profile_name)
+        credentials[self.profile_name]['aws_access_key_id'] = self.access_key
+        credentials[self.profile_name]['aws_secret_access_key'] = self.secret_access_key
+        if self.session_token:
+            credentials[self.profile_name]['aws_session_token'] = self.session_token
         else:
-            return False
+            credentials.remove_option(self.profile_name, 'aws_session_token')
+        _write_ini(credentials, _AWS_CREDENTIALS_FILE)
+        # The files on disk changed; drop the cached copies
+        _CONFIG_CACHE.pop(_AWS_CONFIG_FILE, None)
+        _CONFIG_CACHE.pop(_AWS_CREDENTIALS_FILE, None)
 
     def error(self, error):
         print(self.help)
         sys.exit(error)
 
-    def get_template(self):
-        url = self.url
-        if url[-1] == '/':
-            url = url[:-1]
+    def get_template(self, url, version_date=None):
+        url = _normalize_url(url)
 
         title = 'fireprox_{}'.format(
-            tldextract.extract(url).domain
+            _extract_domain(url)
         )
-        version_date = f'{datetime.datetime.now():%Y-%m-%dT%XZ}'
-        template = '''
-        {
-          "swagger": "2.0",
-          "info": {
-            "version": "{{version_date}}",
-            "title": "{{title}}"
-          },
-          "basePath": "/",
-          "schemes": [
-            "https"
-          ],
-          "paths": {
-            "/": {
-              "get": {
-                "parameters": [
-                  {
-                    "name": "proxy",
-                    "in": "path",
-                    "required": true,
-                    "type": "string"
-                  },
-                  {
-                    "name": "X-My-X-Forwarded-For",
-                    "in": "header",
-                    "required": false,
-                    "type": "string"
-                  }
-                ],
-                "responses": {},
-                "x-amazon-apigateway-integration": {
-                  "uri": "{{url}}/",
-                  "responses": {
-                    "default": {
-                      "statusCode": "200"
-                    }
-                  },
-                  "requestParameters": {
-                    "integration.request.path.proxy": "method.request.path.proxy",
-                    "integration.request.header.X-Forwarded-For": "method.request.header.X-My-X-Forwarded-For"
-                  },
-                  "passthroughBehavior": "when_no_match",
-                  "httpMethod": "ANY",
-                  "cacheNamespace": "irx7tm",
-                  "cacheKeyParameters": [
-                    "method.request.path.proxy"
-                  ],
-                  "type": "http_proxy"
-                }
-              }
-            },
-            "/{proxy+}": {
-              "x-amazon-apigateway-any-method": {
-                "produces": [
-                  "application/json"
-                ],
-                "parameters": [
-                  {
-                    "name": "proxy",
-                    "in": "path",
-                    "required": true,
-                    "type": "string"
-                  },
-                  {
-                    "name": "X-My-X-Forwarded-For",
-                    "in": "header",
-                    "required": false,
-                    "type": "string"
-                  }
-                ],
-                "responses": {},
-                "x-amazon-apigateway-integration": {
-                  "uri": "{{url}}/{proxy}",
-                  "responses": {
-                    "default": {
-                      "statusCode": "200"
-                    }
-                  },
-                  "requestParameters": {
-                    "integration.request.path.proxy": "method.request.path.proxy",
-                    "integration.request.header.X-Forwarded-For": "method.request.header.X-My-X-Forwarded-For"
-                  },
-                  "passthroughBehavior": "when_no_match",
-                  "httpMethod": "ANY",
-                  "cacheNamespace": "irx7tm",
-                  "cacheKeyParameters": [
-                    "method.request.path.proxy"
-                  ],
-                  "type": "http_proxy"
-                }
-              }
-            }
-          }
-        }
-        '''
-        template = template.replace('{{url}}', url)
-        template = template.replace('{{title}}', title)
-        template = template.replace('{{version_date}}', version_date)
-
-        return str.encode(template)
-
-    def create_api(self, url):
+        if version_date is None:
+            # C-level strftime over UTC; the old local-time f-string format
+            # mislabeled the timestamp with a Z suffix
+            version_date = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+        template = copy.deepcopy(_TEMPLATE)
+        template['info']['version'] = version_date
+        template['info']['title'] = title
+        template['paths']['/']['get'][
+            'x-amazon-apigateway-integration']['uri'] = f'{url}/'
+        template['paths']['/{proxy+}']['x-amazon-apigateway-any-method'][
+            'x-amazon-apigateway-integration']['uri'] = url + '/{proxy}'
+
+        if orjson is not None:
+            return orjson.dumps(template)
+        return json.dumps(template, separators=(',', ':')).encode()
+
+    def create_api(self, url, version_date=None):
         if not url:
             self.error('Please provide a valid URL end-point')
 
         print(f'Creating => {url}...')
 
-        template = self.get_template()
+        template = self.get_template(url, version_date)
         response = self.client.import_rest_api(
             parameters={
                 'endpointConfigurationTypes': 'REGIONAL'
@@ -263,8 +437,7 @@ class FireProx(object):
         if not any([api_id, url]):
             self.error('Please provide a valid API ID and URL end-point')
 
-        if url[-1] == '/':
-            url = url[:-1]
+        url = _normalize_url(url)
 
         resource_id = self.get_resource(api_id)
         if resource_id:
@@ -288,31 +461,80 @@ class FireProx(object):
     def delete_api(self, api_id):
         if not api_id:
             self.error('Please provide a valid API ID')
-        items = self.list_api(api_id)
-        for item in items:
-            item_api_id = item['id']
-            if item_api_id == api_id:
-                response = self.client.delete_rest_api(
-                    restApiId=api_id
-                )
-                return True
-        return False
+        # delete_rest_api tells us itself when the id is unknown; listing
+        # the whole account first was pure overhead. Throttling retries are
+        # handled by the client's adaptive retry mode.
+        try:
+            self.client.delete_rest_api(
+                restApiId=api_id
+            )
+            # A cached resource id for a deleted API would poison a later
+            # create/update that reuses the same id
+            self._resource_cache.pop(api_id, None)
+            return True
+        except self.client.exceptions.NotFoundException:
+            return False
 
-    def list_api(self, deleted_api_id=None):
-        response = self.client.get_rest_apis()
-        for item in response['items']:
+    def delete_all(self, filter_fn=None):
+        # One paginated listing, then parallel deletes: linear in the
+        # number of APIs instead of a listing per delete. The adaptive
+        # retry mode paces the pool against API Gateway throttling.
+        if filter_fn is None:
+            filter_fn = lambda item: item.get('name', '').startswith('fireprox_')
+        paginator = self.client.get_paginator('get_rest_apis')
+        api_ids = [item['id'] for page in paginator.paginate()
+                   for item in page['items'] if filter_fn(item)]
+        if not api_ids:
+            return []
+        if self.session:
+            self.session.get_credentials()
+        deleted = []
+        with ThreadPoolExecutor(max_workers=min(20, len(api_ids))) as executor:
+            for api_id, result in zip(api_ids, executor.map(self.delete_api, api_ids)):
+                success = 'Success!' if result else 'Failed!'
+                print(f'Deleting {api_id} => {success}')
+                if result:
+                    deleted.append(api_id)
+        return deleted
+
+    def list_api(self):
+        # get_rest_apis pages at 25 items by default; walk every page so
+        # large accounts are not silently truncated
+        paginator = self.client.get_paginator('get_rest_apis')
+        items = [item for page in paginator.paginate()
+                 for item in page['items']]
+
+        # Region half of the proxy URL never changes; format in only the id
+        url_template = f'https://{{}}.execute-api.{self.region}.amazonaws.com/fireprox/'
+
+        def describe(item):
             try:
                 created_dt = item['createdDate']
                 api_id = item['id']
                 name = item['name']
-                proxy_url = self.get_integration(api_id).replace('{proxy}', '')
-                url = f'https://{api_id}.execute-api.{self.region}.amazonaws.com/fireprox/'
-                if not api_id == deleted_api_id:
-                    print(f'[{created_dt}] ({api_id}) {name}: {url} => {proxy_url}')
-            except:
+                # Non-fireprox APIs have no proxy integration; skip them
+                # up front instead of manufacturing a failed lookup
+                if not name.startswith('fireprox_'):
+                    return None
+                integration = self.get_integration(api_id)
+                if integration is None:
+                    return None
+                proxy_url = integration.replace('{proxy}', '')
+                url = url_template.format(api_id)
+                return f'[{created_dt}] ({api_id}) {name}: {url} => {proxy_url}'
+            except (self.client.exceptions.ClientError, KeyError, TypeError):
                 pass
+            return None
 
-        return response['items']
+        if items:
+            # The per-API integration lookups are independent round-trips,
+            # so resolve them concurrently and print in the original order
+            with ThreadPoolExecutor(max_workers=min(16, len(items))) as executor:
+                for line in executor.map(describe, items):
+                    if line:
+                        print(line)
+
+        return items
 
     def store_api(self, api_id, name, created_dt, version_dt, url,
                   resource_id, proxy_url):
@@ -337,19 +559,43 @@ class FireProx(object):
     def get_resource(self, api_id):
         if not api_id:
             self.error('Please provide a valid API ID')
+        if api_id in self._resource_cache:
+            return self._resource_cache[api_id]
         response = self.client.get_resources(restApiId=api_id)
-        items = response['items']
-        for item in items:
-            item_id = item['id']
-            item_path = item['path']
-            if item_path == '/{proxy+}':
-                return item_id
-        return None
+        resource_id = next(
+            (item['id'] for item in response['items']
+             if item['path'] == '/{proxy+}'),
+            None
+        )
+        if resource_id is not None:
+            self._resource_cache[api_id] = resource_id
+        return resource_id
 
     def get_integration(self, api_id):
         if not api_id:
             self.error('Please provide a valid API ID')
-        resource_id = self.get_resource(api_id)
+        # Asking get_resources to embed the methods returns the resource id
+        # and the integration URI in one round-trip instead of two
+        response = self.client.get_resources(
+            restApiId=api_id,
+            embed=['methods']
+        )
+        resource_id = None
+        for item in response['items']:
+            if item['path'] == '/{proxy+}':
+                resource_id = item['id']
+                self._resource_cache[api_id] = resource_id
+                integration = item.get('resourceMethods', {}).get(
+                    'ANY', {}).get('methodIntegration')
+                if integration is not None:
+                    return integration['uri']
+                break
+        # No /{proxy+} resource at all: not a fireprox-shaped API, and
+        # passing resource_id=None to the fallback would raise a
+        # ParamValidationError that callers filtering on ClientError miss
+        if resource_id is None:
+            return None
+        # Nothing embedded; fall back to the explicit lookup
         response = self.client.get_integration(
             restApiId=api_id,
             resourceId=resource_id,
@@ -375,11 +621,13 @@ def parse_arguments() -> Tuple[argparse.Namespace, str]:
     parser.add_argument('--region',
                         help='AWS Region', type=str, default=None)
     parser.add_argument('--command',
-                        help='Commands: list, create, delete, update', type=str, default=None)
+                        help='Commands: list, create, delete, update, prune', type=str, default=None)
     parser.add_argument('--api_id',
-                        help='API ID', type=str, required=False)
+                        help='API ID (comma-separate several for bulk delete)', type=str, required=False)
     parser.add_argument('--url',
                         help='URL end-point', type=str, required=False)
+    parser.add_argument('--urls_file',
+                        help='File with one URL end-point per line to create in batch', type=str, required=False)
     return parser.parse_args(), parser.format_help()
 
 
@@ -395,12 +643,49 @@ def main():
         result = fp.list_api()
 
     elif args.command == 'create':
-        result = fp.create_api(fp.url)
+        if fp.urls_file:
+            # One process, one client: the per-invocation startup cost is
+            # paid once, and the import/deploy round-trips overlap across
+            # the batch (the client is thread-safe)
+            with open(fp.urls_file) as file:
+                urls = [line.strip() for line in file if line.strip()]
+            if urls:
+                # Resolve credentials once on the main thread; left lazy,
+                # every worker would race the first signing through
+                # credential_process / STS at the same instant
+                if fp.session:
+                    fp.session.get_credentials()
+                # One timestamp for the whole batch: stamps every API in
+                # the run identically and skips per-URL strftime calls
+                version_date = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+                with ThreadPoolExecutor(max_workers=min(16, len(urls))) as executor:
+                    list(executor.map(
+                        functools.partial(fp.create_api, version_date=version_date),
+                        urls))
+        else:
+            result = fp.create_api(fp.url)
 
     elif args.command == 'delete':
-        result = fp.delete_api(fp.api_id)
-        success = 'Success!' if result else 'Failed!'
-        print(f'Deleting {fp.api_id} => {success}')
+        api_ids = ([api_id.strip() for api_id in fp.api_id.split(',') if api_id.strip()]
+                   if fp.api_id else [])
+        if len(api_ids) > 1:
+            # Deletes are independent round-trips; overlap them and let the
+            # adaptive retry mode pace any throttling
+            if fp.session:
+                fp.session.get_credentials()
+            with ThreadPoolExecutor(max_workers=min(8, len(api_ids))) as executor:
+                for api_id, result in zip(api_ids, executor.map(fp.delete_api, api_ids)):
+                    success = 'Success!' if result else 'Failed!'
+                    print(f'Deleting {api_id} => {success}')
+        else:
+            result = fp.delete_api(fp.api_id)
+            success = 'Success!' if result else 'Failed!'
+            print(f'Deleting {fp.api_id} => {success}')
+
+    elif args.command == 'prune':
+        print(f'Deleting all fireprox APIs...')
+        deleted = fp.delete_all()
+        print(f'Deleted: {len(deleted)}')
 
     elif args.command == 'update':
         print(f'Updating {fp.api_id} => {fp.url}...')